@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Annotated, Any, Coroutine
@@ -20,8 +21,14 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+_EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+
 
 class BaseAgent(ABC):
+    # Rendered system prompts keyed on the agent class; an agent's tool set is fixed per type
+    _system_prompts: dict[type, str] = {}
+
     @classmethod
     @property
     @abstractmethod
@@ -51,6 +58,19 @@ class BaseAgent(ABC):
             response_format=response_format
         )
 
+    @classmethod
+    def build_system_prompt(cls, template: str, tools: list[BaseTool]) -> str:
+        """Render the system prompt for this agent type once and reuse it for every later instance."""
+        system_prompt = BaseAgent._system_prompts.get(cls)
+        if system_prompt is None:
+            # Tool descriptions are dedented triple-quoted strings; drop their padding newlines and any
+            # blank-line runs so every model turn does not pay for whitespace tokens
+            tool_descriptions = "\n".join(f"- {tool.name}: {tool.description.strip()}" for tool in tools)
+            system_prompt = template.format_map({"tools": tool_descriptions})
+            system_prompt = _EXTRA_BLANK_LINES.sub("\n\n", _TRAILING_WHITESPACE.sub("", system_prompt))
+            BaseAgent._system_prompts[cls] = system_prompt
+        return system_prompt
+
     async def arun(self, task: str, config: RunnableConfig):
         input_data = {"messages": [("user", task)]}
         for attempt in range(4):
@@ -71,16 +91,45 @@ class AgentInput(BaseModel):
     task_description: str = Field(description="A detailed description of the task.")
 
 
-def agent_to_tool(agent: BaseAgent) -> BaseTool:
+def agent_to_tool(agent_cls: type[BaseAgent], model: BaseChatModel) -> BaseTool:
+    # The agent is built on its first delegated task, so a single-domain query only pays
+    # for compiling the agents it actually routes to. Construction runs off the event loop
+    # so parallel delegations (and other sessions) are not stalled by graph compilation.
+    agent: BaseAgent | None = None
+    # Identical delegations already running in the same conversation, and reporting to the same
+    # callback run, share one run
+    in_flight: dict[tuple[str, Any, str], asyncio.Future] = {}
+
+    async def delegate(task_description: str, config: RunnableConfig) -> AIMessage:
+        nonlocal agent
+        if agent is None:
+            agent = await asyncio.to_thread(agent_cls, model)
+        return await agent.arun(task_description, config)
+
     class Tool(BaseTool):
-        name: str = f"delegate_to_{agent.name}"
-        description: str = agent.description
+        name: str = f"delegate_to_{agent_cls.name}"
+        description: str = agent_cls.description
         args_schema: ArgsSchema = AgentInput
 
         def _run(self, task_description: str) -> str:
             raise NotImplementedError("Use async execution.")
 
         async def _arun(self, task_description: str, config: Annotated[RunnableConfig, InjectedToolArg]) -> AIMessage:
-            return await agent.arun(task_description, config)
+            thread_id = config.get("configurable", {}).get("thread_id")
+            if thread_id is None:
+                return await delegate(task_description, config)
+
+            # The shared run streams its events through the first caller's callbacks, so only callers
+            # reporting to that same run may join it. IDs in the task text are case-sensitive; only
+            # whitespace is normalized.
+            callbacks = config.get("callbacks")
+            parent = getattr(callbacks, "parent_run_id", None) or id(callbacks)
+            key = (thread_id, parent, " ".join(task_description.split()))
+            run = in_flight.get(key)
+            if run is None:
+                run = asyncio.ensure_future(delegate(task_description, config))
+                in_flight[key] = run
+                run.add_done_callback(lambda _: in_flight.pop(key, None))
+            return await asyncio.shield(run)
 
     return Tool()
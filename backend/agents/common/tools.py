@@ -1,8 +1,10 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Annotated, Any
+from datetime import date, time
+from typing import Annotated, Any, Callable, Optional
 
+import orjson
 from google.auth.exceptions import RefreshError
 from google_client.utils.datetime import current_datetime
 from googleapiclient.errors import HttpError
@@ -15,6 +17,21 @@ from core.exceptions import ProviderNotConnectedError
 logger = logging.getLogger(__name__)
 
 
+def to_json(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize a tool result with orjson; `default` handles types orjson doesn't know natively."""
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits, which the stdlib encoder still handles. The stdlib
+        # encoder doesn't know the dates and times orjson serializes natively, so those are encoded the same way.
+        def fallback(value: Any) -> Any:
+            if isinstance(value, (date, time)):
+                return value.isoformat()
+            return default(value) if default is not None else str(value)
+
+        return json.dumps(obj, default=fallback)
+
+
 class CurrentDateTimeTool(BaseTool):
     name: str = "current_datetime_tool"
     description: str = "Returns the current date and time."
@@ -48,7 +65,7 @@ class BaseGoogleTool(BaseTool, ABC):
         try:
             result = await self._run_google_task(config, **kwargs)
             if isinstance(result, (dict, list)):
-                return json.dumps(result)
+                return to_json(result)
             return str(result)
 
         except (ProviderNotConnectedError, RefreshError):
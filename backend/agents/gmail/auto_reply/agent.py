@@ -1,7 +1,6 @@
 from pathlib import Path
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent
 from agents.common.tools import CurrentDateTimeTool
@@ -24,7 +23,6 @@ class GmailAutoReplyAgent(BaseAgent):
             DraftEmailTool(),
         ]
 
-        tool_descriptions = [f"- {tool.name}: {tool.description}" for tool in tools]
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
@@ -7,6 +7,7 @@ from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langgraph.types import interrupt
+from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
 from agents.common.tools import BaseGoogleTool
@@ -14,6 +15,45 @@ from core.auth import get_gmail_service
 
 logger = logging.getLogger(__name__)
 
+# users.messages.batchModify accepts at most 1000 message ids per request
+_BATCH_MODIFY_LIMIT = 1000
+
+
+async def _batch_modify_labels(gmail, message_ids: list[str], label_id: str, add: bool) -> int:
+    """Add or remove a label on many messages with one batchModify request per 1000 ids; returns how many succeeded."""
+    loop = asyncio.get_running_loop()
+    label_key = "addLabelIds" if add else "removeLabelIds"
+
+    def modify(message_id: str) -> asyncio.Future:
+        # The client's remove_label reports failure for plain message ids, so the fallback sends
+        # messages.modify itself; each request builds its own service, as the client's calls do
+        return loop.run_in_executor(
+            gmail._executor,
+            lambda: gmail._service().users().messages().modify(
+                userId='me', id=message_id, body={label_key: [label_id]}
+            ).execute()
+        )
+
+    modified = 0
+    for i in range(0, len(message_ids), _BATCH_MODIFY_LIMIT):
+        chunk = message_ids[i:i + _BATCH_MODIFY_LIMIT]
+        body = {"ids": chunk, label_key: [label_id]}
+        try:
+            await loop.run_in_executor(
+                gmail._executor,
+                lambda: gmail._service().users().messages().batchModify(userId='me', body=body).execute()
+            )
+            modified += len(chunk)
+        except HttpError as e:
+            # One bad or missing id fails the whole request; retry just this chunk per message. Quota, server and
+            # auth errors are re-raised so they aren't multiplied into one request per message
+            if e.status_code not in (400, 404):
+                raise
+            logger.warning(f"batchModify rejected {len(chunk)} message(s), retrying per message: {e}")
+            results = await asyncio.gather(*[modify(mid) for mid in chunk], return_exceptions=True)
+            modified += sum(1 for r in results if not isinstance(r, Exception))
+    return modified
+
 
 class ApplyLabelInput(BaseModel):
     message_ids: list[str] = Field(description="The Message IDs of the emails to label")
@@ -52,10 +92,7 @@ class ApplyLabelTool(BaseGoogleTool):
             {"text": "Applying Labels...", "icon": "📩"}
         )
         gmail = await get_gmail_service(config)
-        results = await asyncio.gather(
-            *[gmail.add_label(email=mid, labels=[label_id]) for mid in message_ids]
-        )
-        successes = sum(1 for r in results if r)
+        successes = await _batch_modify_labels(gmail, message_ids, label_id, add=True)
         return f"Label {label_id} applied to {successes} of {len(message_ids)} email(s)."
 
 
@@ -96,10 +133,7 @@ class RemoveLabelTool(BaseGoogleTool):
             {"text": "Removing Label...", "icon": "🏷️"}
         )
         gmail = await get_gmail_service(config)
-        results = await asyncio.gather(
-            *[gmail.remove_label(email=mid, labels=[label_id]) for mid in message_ids]
-        )
-        successes = sum(1 for r in results if r)
+        successes = await _batch_modify_labels(gmail, message_ids, label_id, add=False)
         return f"Label {label_id} removed from {successes} of {len(message_ids)} email(s)."
 
 
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import tempfile
 import uuid
@@ -14,7 +13,7 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_gmail_service, get_drive_service
 from core.cache import get_email_cache
 from core.supabase_client import upload_to_supabase
@@ -62,7 +61,7 @@ class GetEmailTool(BaseGoogleTool):
                     email_map[result.message_id] = email_cache.save(result)
 
         emails = [email_map[mid] for mid in message_ids if mid in email_map]
-        return json.dumps(emails)
+        return to_json(emails)
 
 
 class GetThreadDetailsInput(BaseModel):
@@ -116,7 +115,7 @@ class GetThreadDetailsTool(BaseGoogleTool):
                     for msg in thread.messages
                 ]
             })
-        return json.dumps(results)
+        return to_json(results)
 
 
 class SearchEmailsInput(BaseModel):
@@ -282,7 +281,7 @@ class SearchEmailsTool(BaseGoogleTool):
         query = build_query(gmail, params)
         message_ids = await query.execute()
 
-        return "Here are the message_ids for the search query:\n" + json.dumps(message_ids)
+        return "Here are the message_ids for the search query:\n" + to_json(message_ids)
 
 
 class DownloadAttachmentInput(BaseModel):
@@ -373,7 +372,7 @@ class DownloadAttachmentTool(BaseGoogleTool):
             else:
                 results.append(res)
 
-        return json.dumps(results)
+        return to_json(results)
 
 
 class ListUserLabelsTool(BaseGoogleTool):
@@ -399,4 +398,4 @@ class ListUserLabelsTool(BaseGoogleTool):
             "name": label.name
         } for label in user_labels
         ]
-        return json.dumps(user_labels)
+        return to_json(user_labels)
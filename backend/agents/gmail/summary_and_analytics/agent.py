@@ -2,7 +2,6 @@ from pathlib import Path
 from textwrap import dedent
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent
 from agents.common.tools import CurrentDateTimeTool
@@ -28,9 +27,6 @@ class SummaryAndAnalyticsAgent(BaseAgent):
             ClassifyEmailTool(),
         ]
 
-        tool_descriptions = []
-        for tool in tools:
-            tool_descriptions.append(f"- {tool.name}: {tool.description}")
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from textwrap import dedent
 from typing import Optional, Literal, Annotated
@@ -11,7 +10,7 @@ from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_gmail_service
 from core.cache import get_email_cache
 
@@ -103,7 +102,7 @@ class SummarizeEmailsTool(BaseGoogleTool):
         )
 
         llm = ChatGoogleGenerativeAI(model='gemini-2.5-flash')
-        response = await llm.ainvoke([SystemMessage(system_prompt), HumanMessage(json.dumps(emails))])
+        response = await llm.ainvoke([SystemMessage(system_prompt), HumanMessage(to_json(emails))])
         return response.content
 
 
@@ -199,9 +198,9 @@ class ExtractFromEmailTool(BaseGoogleTool):
 
             extraction_prompt = dedent(
                 f"""
-                    email_content: {json.dumps(email_batch)}
+                    email_content: {to_json(email_batch)}
                     
-                    extraction_schema: {json.dumps(fields)}
+                    extraction_schema: {to_json(fields)}
                 """
             )
 
@@ -213,7 +212,7 @@ class ExtractFromEmailTool(BaseGoogleTool):
 
         combined = [item for batch in results for item in batch.extracted_data]
 
-        return json.dumps(combined)
+        return to_json(combined)
 
 
 class ClassifyEmailInput(BaseModel):
@@ -293,9 +292,9 @@ class ClassifyEmailTool(BaseGoogleTool):
 
             classification_prompt = dedent(
                 f"""
-                    emails: {json.dumps(email_batch)}
+                    emails: {to_json(email_batch)}
                     
-                    categories: {json.dumps(classifications)}
+                    categories: {to_json(classifications)}
                 """)
 
             result = await llm.with_structured_output(ClassifyEmailOutput).ainvoke([
@@ -306,4 +305,4 @@ class ClassifyEmailTool(BaseGoogleTool):
 
         combined = [item.model_dump() for batch in results for item in batch.classifications]
 
-        return json.dumps(combined)
\ No newline at end of file
+        return to_json(combined)
\ No newline at end of file
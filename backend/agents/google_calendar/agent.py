@@ -1,7 +1,6 @@
 from pathlib import Path
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent
 from .tools import *
@@ -23,14 +22,12 @@ class CalendarAgent(BaseAgent):
             GetEventsTool(),
             ListEventsTool(),
             CreateEventTool(),
+            CreateEventsTool(),
             DeleteEventTool(),
             UpdateEventTool(),
             AddGoogleMeetsToEventTool(),
             FindFreeSlotsTool(),
         ]
-        tool_descriptions = []
-        for tool in tools:
-            tool_descriptions.append(f"- {tool.name}: {tool.description}")
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
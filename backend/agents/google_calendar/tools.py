@@ -1,6 +1,7 @@
-import json
+import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Literal, Union, Annotated
 
 from langchain_core.callbacks import adispatch_custom_event
@@ -8,13 +9,52 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_calendar_service
+from core.cache import get_calendar_cache
 from google_client.services.calendar import EventQueryBuilder, Attendee
 from google_client.services.calendar.async_query_builder import AsyncEventQueryBuilder
+from google_client.utils.datetime import datetime_to_iso
 
 logger = logging.getLogger(__name__)
 
+# date_filter value -> EventQueryBuilder method applying that range
+_DATE_FILTERS = {
+    "TODAY": "today",
+    "TOMORROW": "tomorrow",
+    "THIS_WEEK": "this_week",
+    "NEXT_WEEK": "next_week",
+    "THIS_MONTH": "this_month",
+}
+# list_events param -> EventQueryBuilder method taking that value; date_filter is applied afterwards
+_QUERY_METHODS = {
+    "max_results": "limit",
+    "datetime_min": "from_date",
+    "datetime_max": "to_date",
+    "search": "search",
+    "by_attendee": "by_attendee",
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an RFC3339 timestamp; the model keeps sending the same range boundaries, and datetimes are immutable."""
+    return datetime.fromisoformat(value)
+
+
+async def _patch_event(calendar_service, calendar_id: str, event_id: str, changes: dict) -> dict:
+    """PATCH the given fields of an event, the way the client's own event methods run their requests.
+
+    The client has no patch method; this runs on its executor and lets HttpError propagate like its other calls.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        calendar_service._executor,
+        lambda: calendar_service._service().events().patch(
+            calendarId=calendar_id, eventId=event_id, body=changes
+        ).execute()
+    )
+
 
 class ListCalendarsTool(BaseGoogleTool):
     name: str = "list_calendars"
@@ -29,10 +69,14 @@ class ListCalendarsTool(BaseGoogleTool):
             "tool_status",
             {"text": "Listing Calendars...", "icon": "📅"}
         )
+        cache = get_calendar_cache(config)
+        if cached := cache.get(("calendars",)):
+            return cached
         calendar = await get_calendar_service(config)
         calendars = await calendar.list_calendars()
-        calendars = [{'name': calendar.summary, 'id': calendar.id} for calendar in calendars]
-        return json.dumps(calendars)
+        return cache.save(
+            ("calendars",), to_json(calendars, default=lambda calendar: {'name': calendar.summary, 'id': calendar.id})
+        )
 
 
 class CreateCalendarInput(BaseModel):
@@ -54,8 +98,9 @@ class CreateCalendarTool(BaseGoogleTool):
         )
         calendar_service = await get_calendar_service(config)
         calendar = await calendar_service.create_calendar(name)
+        get_calendar_cache(config).clear()
         calendar_data = [{'name': calendar.summary, 'id': calendar.id}]
-        return json.dumps(calendar_data)
+        return to_json(calendar_data)
 
 
 class DeleteCalendarInput(BaseModel):
@@ -77,6 +122,7 @@ class DeleteCalendarTool(BaseGoogleTool):
         )
         calendar_service = await get_calendar_service(config)
         await calendar_service.delete_calendar(calendar_id)
+        get_calendar_cache(config).clear()
         return "Calendar deleted"
 
 
@@ -104,7 +150,7 @@ class GetEventsTool(BaseGoogleTool):
         calendar_service = await get_calendar_service(config)
         event = await calendar_service.get_event(event_id, calendar_id)
         event_dict = event.to_dict()
-        return json.dumps(event_dict)
+        return to_json(event_dict)
 
 
 class ListEventsInput(BaseModel):
@@ -157,45 +203,33 @@ class ListEventsTool(BaseGoogleTool):
             "tool_status",
             {"text": "Getting Events...", "icon": "📅"}
         )
+        cache = get_calendar_cache(config)
+        cache_key = ("events", calendar_id, max_results, datetime_min, datetime_max, date_filter, query, by_attendee)
+        if cached := cache.get(cache_key):
+            return cached
         calendar_service = await get_calendar_service(config)
         params = {
             "calendar_id": calendar_id,
             "max_results": max_results,
-            "datetime_min": datetime.fromisoformat(datetime_min.replace('Z', '')) if datetime_min else None,
-            "datetime_max": datetime.fromisoformat(datetime_max.replace('Z', '')) if datetime_max else None,
+            "datetime_min": _parse_datetime(datetime_min.replace('Z', '')) if datetime_min else None,
+            "datetime_max": _parse_datetime(datetime_max.replace('Z', '')) if datetime_max else None,
             "date_filter": date_filter,
             "search": query,
             "by_attendee": by_attendee
         }
+        # Only filters that are actually set reach the query builder
+        params = {key: value for key, value in params.items() if value}
         builder = self.query_builder(calendar_service, params)
         events = await builder.execute()
-        events_data = [event.to_dict() for event in events]
-        return json.dumps(events_data)
+        return cache.save(cache_key, to_json(events, default=lambda event: event.to_dict()))
 
     def query_builder(self, service, params: dict) -> Union[EventQueryBuilder, AsyncEventQueryBuilder]:
-        builder = service.query().in_calendar(params["calendar_id"])
-        if params.get("max_results"):
-            builder = builder.limit(params["max_results"])
-        if params.get("datetime_min"):
-            builder = builder.from_date(params["datetime_min"])
-        if params.get("datetime_max"):
-            builder = builder.to_date(params["datetime_max"])
-        if params.get("date_filter"):
-            match params["date_filter"]:
-                case "TODAY":
-                    builder = builder.today()
-                case "TOMORROW":
-                    builder = builder.tomorrow()
-                case "THIS_WEEK":
-                    builder = builder.this_week()
-                case "NEXT_WEEK":
-                    builder = builder.next_week()
-                case "THIS_MONTH":
-                    builder = builder.this_month()
-        if params.get("search"):
-            builder = builder.search(params["search"])
-        if params.get("by_attendee"):
-            builder = builder.by_attendee(params["by_attendee"])
+        builder = service.query().in_calendar(params.get("calendar_id"))
+        for key, method in _QUERY_METHODS.items():
+            if key in params:
+                builder = getattr(builder, method)(params[key])
+        if params.get("date_filter") in _DATE_FILTERS:
+            builder = getattr(builder, _DATE_FILTERS[params["date_filter"]])()
 
         return builder
 
@@ -253,8 +287,8 @@ class CreateEventTool(BaseGoogleTool):
             attendees = []
         calendar_service = await get_calendar_service(config)
         event = await calendar_service.create_event(
-            start=datetime.fromisoformat(start_datetime),
-            end=datetime.fromisoformat(end_datetime),
+            start=_parse_datetime(start_datetime),
+            end=_parse_datetime(end_datetime),
             summary=summary,
             description=description,
             location=location,
@@ -263,9 +297,70 @@ class CreateEventTool(BaseGoogleTool):
             recurrence=recurrence,
             calendar_id=calendar_id
         )
+        get_calendar_cache(config).clear()
         return f"Event created successfully. event_id: {event.event_id}, calendar_id: {event.calendar_id}"
 
 
+class NewEventInput(BaseModel):
+    summary: str = Field(description="The summary or title of the event")
+    start_datetime: str = Field(description="RFC3339 timestamp string for the event start time")
+    end_datetime: str = Field(description="RFC3339 timestamp string for the event end time")
+    description: Optional[str] = Field(default=None, description="The description of the event")
+    location: Optional[str] = Field(default=None, description="The location of the event")
+    attendees: Optional[List[str]] = Field(default=None, description="List of attendee writer addresses")
+    create_google_meet: bool = Field(default=False, description="Whether or not to add a google meet link to the event")
+    recurrence: Optional[List[str]] = Field(default=None, description="Recurrence rules for the event in RRULE format")
+
+
+class CreateEventsInput(BaseModel):
+    events: List[NewEventInput] = Field(description="The events to create")
+    calendar_id: Optional[str] = Field('primary',
+                                       description="The calendar_id of where to create the events. Default is primary")
+
+
+class CreateEventsTool(BaseGoogleTool):
+    name: str = "create_events"
+    description: str = "Create several events at once on one calendar. Use instead of calling create_event repeatedly"
+    args_schema: ArgsSchema = CreateEventsInput
+
+    def _run(self, events: List[NewEventInput], config: Annotated[RunnableConfig, InjectedToolArg],
+             calendar_id: str = 'primary') -> str:
+        raise NotImplementedError("Use async execution.")
+
+    async def _run_google_task(self, config: RunnableConfig, events: List[NewEventInput],
+                               calendar_id: str = 'primary') -> str:
+        await adispatch_custom_event(
+            "tool_status",
+            {"text": "Creating Events...", "icon": "📅"}
+        )
+        calendar_service = await get_calendar_service(config)
+        events_data = [
+            {
+                "summary": event.summary,
+                "start": _parse_datetime(event.start_datetime),
+                "end": _parse_datetime(event.end_datetime),
+                "description": event.description,
+                "location": event.location,
+                "attendees": [Attendee(email=attendee) for attendee in event.attendees or []],
+                "create_google_meet": event.create_google_meet,
+                "recurrence": event.recurrence,
+            }
+            for event in events
+        ]
+        # Inserts go out as Calendar batch requests instead of one HTTP round trip per event
+        results = await calendar_service.batch_create_events(events_data, calendar_id=calendar_id)
+        get_calendar_cache(config).clear()
+        created = [
+            {"summary": event.summary, "event_id": event.event_id, "calendar_id": event.calendar_id}
+            for event in results if not isinstance(event, tuple)
+        ]
+        errors = sum(1 for event in results if isinstance(event, tuple))
+        msg = f"{len(created)} of {len(events)} event(s) created: {to_json(created)}"
+        if errors:
+            msg += f" {errors} failed."
+        return msg
+
+
 class DeleteEventInput(BaseModel):
     event_ids: list[str] = Field(description="The event_ids of the events to delete")
     calendar_id: Optional[str] = Field('primary',
@@ -289,6 +384,7 @@ class DeleteEventTool(BaseGoogleTool):
         )
         calendar_service = await get_calendar_service(config)
         results = await calendar_service.batch_delete_events(events=event_ids, calendar_id=calendar_id)
+        get_calendar_cache(config).clear()
         successes = sum(1 for r in results if r is True)
         errors = sum(1 for r in results if isinstance(r, tuple))
         msg = f"{successes} of {len(event_ids)} event(s) deleted from calendar '{calendar_id}'."
@@ -359,30 +455,48 @@ class UpdateEventTool(BaseGoogleTool):
             {"text": "Updating Event...", "icon": "📅"}
         )
         calendar_service = await get_calendar_service(config)
-        event = await calendar_service.get_event(event_id=event_id, calendar_id=calendar_id)
+        timezone = config['configurable'].get('timezone', 'UTC')
+
+        # Patch only the provided fields: one request instead of get + full PUT, and fields this
+        # tool doesn't model (conference data, reminders, colors) are left untouched
+        changes = {}
         if summary:
-            event.summary = summary
+            changes["summary"] = summary
         if start_datetime:
-            event.start = datetime.fromisoformat(start_datetime)
+            changes["start"] = {"dateTime": datetime_to_iso(_parse_datetime(start_datetime), timezone), "timeZone": timezone}
         if end_datetime:
-            event.end = datetime.fromisoformat(end_datetime)
+            changes["end"] = {"dateTime": datetime_to_iso(_parse_datetime(end_datetime), timezone), "timeZone": timezone}
         if description:
-            event.description = description
+            changes["description"] = description
         if location:
-            event.location = location
-        if attendees:
-            event.attendees = [Attendee(email=email) for email in attendees]
-        if add_attendees:
-            existing_emails = {attendee.email for attendee in event.attendees} if event.attendees else set()
-            new_attendees = [Attendee(email=email) for email in add_attendees if email not in existing_emails]
-            event.attendees = (event.attendees or []) + new_attendees
-        if remove_attendees and event.attendees:
-            event.attendees = [attendee for attendee in event.attendees if attendee.email not in remove_attendees]
+            changes["location"] = location
         if recurrence:
-            event.recurrence = recurrence
-
-        updated_event = await calendar_service.update_event(event=event)
-        return f"Event updated successfully. event_id: {updated_event.event_id}, calendar_id: {updated_event.calendar_id}"
+            changes["recurrence"] = recurrence
+
+        new_attendees = [Attendee(email=email) for email in attendees] if attendees else None
+        if add_attendees or remove_attendees:
+            # Only attendee edits relative to the current list need the event fetched first
+            if new_attendees is None:
+                event = await calendar_service.get_event(event_id=event_id, calendar_id=calendar_id)
+                new_attendees = event.attendees or []
+            if add_attendees:
+                existing_emails = {attendee.email for attendee in new_attendees}
+                # dict.fromkeys drops repeated addresses in the request while keeping their order
+                new_attendees.extend(
+                    Attendee(email=email) for email in dict.fromkeys(add_attendees) if email not in existing_emails
+                )
+            if remove_attendees:
+                removed_emails = set(remove_attendees)
+                new_attendees = [attendee for attendee in new_attendees if attendee.email not in removed_emails]
+        if new_attendees is not None:
+            changes["attendees"] = [attendee.to_dict() for attendee in new_attendees]
+
+        if not changes:
+            return f"No changes provided for event_id: {event_id}, calendar_id: {calendar_id}"
+
+        updated_event = await _patch_event(calendar_service, calendar_id, event_id, changes)
+        get_calendar_cache(config).clear()
+        return f"Event updated successfully. event_id: {updated_event['id']}, calendar_id: {calendar_id}"
 
 class AddGoogleMeetsToEventInput(BaseModel):
     calendar_id: Optional[str] = Field('primary',
@@ -414,6 +528,7 @@ class AddGoogleMeetsToEventTool(BaseGoogleTool):
         )
         calendar_service = await get_calendar_service(config)
         await calendar_service.add_meeting(event_id, calendar_id)
+        get_calendar_cache(config).clear()
         return f"Meeting Link added successfully. event_id: {event_id}, calendar_id: {calendar_id}"
 
 class FindFreeSlotsInput(BaseModel):
@@ -454,12 +569,10 @@ class FindFreeSlotsTool(BaseGoogleTool):
         calendar_service = await get_calendar_service(config)
         free_slots = await calendar_service.find_free_slots(
             duration_minutes=duration_minutes,
-            start=datetime.fromisoformat(datetime_min) if datetime_min else None,
-            end=datetime.fromisoformat(datetime_max) if datetime_max else None,
+            start=_parse_datetime(datetime_min) if datetime_min else None,
+            end=_parse_datetime(datetime_max) if datetime_max else None,
             calendar_ids=calendar_ids
         )
 
-        for key in free_slots:
-            free_slots[key] = str(free_slots[key])
-
-        return json.dumps(free_slots)
\ No newline at end of file
+        # orjson writes the slot datetimes as RFC3339 natively; only the TimeSlot wrapper needs a hook
+        return to_json(free_slots, default=lambda slot: {"start": slot.start, "end": slot.end})
\ No newline at end of file
@@ -1,12 +1,11 @@
 from typing import Optional, Annotated, List, Dict
 from pydantic import BaseModel, Field
-import json
 import logging
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langchain_core.callbacks import adispatch_custom_event
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_docs_service
 
 logger = logging.getLogger(__name__)
@@ -77,4 +76,4 @@ class GetDocumentLinksTool(BaseGoogleTool):
         )
         docs = await get_docs_service(config)
         links = await docs.get_document_links(document_id)
-        return json.dumps(links)
+        return to_json(links)
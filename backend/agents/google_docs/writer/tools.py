@@ -1,13 +1,13 @@
 from typing import Optional, Annotated, List, Dict, Any
 from pydantic import BaseModel, Field
-import json
 import logging
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langchain_core.callbacks import adispatch_custom_event
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_docs_service
+from core.cache import get_drive_cache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,8 @@ class CreateDocumentTool(BaseGoogleTool):
         await adispatch_custom_event("tool_status", {"text": "Creating Document...", "icon": "📝"})
         docs = await get_docs_service(config)
         doc = await docs.create_document(title)
+        # The new document is a Drive file, so cached Drive searches/listings are now stale
+        get_drive_cache(config).clear()
         return f"Document created successfully. document_id: {doc.document_id}"
 
 
@@ -223,6 +225,6 @@ class BatchUpdateTool(BaseGoogleTool):
         docs = await get_docs_service(config)
         try:
             result = await docs.batch_update(document_id, requests)
-            return json.dumps(result)
+            return to_json(result)
         except Exception as e:
-            return f"Failed: {str(e)}"
+            return f"Failed: {e}"
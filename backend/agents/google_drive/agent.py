@@ -1,7 +1,6 @@
 from pathlib import Path
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent, agent_to_tool
 from .organization.agent import OrganizationAgent
@@ -18,16 +17,13 @@ class DriveAgent(BaseAgent):
 
     def __init__(self, model: BaseChatModel):
         tools = [
-            agent_to_tool(agent) for agent in [
-                OrganizationAgent(model),
-                SearchAndRetrievalAgent(model),
-                WriterAgent(model)
+            agent_to_tool(agent_cls, model) for agent_cls in [
+                OrganizationAgent,
+                SearchAndRetrievalAgent,
+                WriterAgent
             ]
         ] + [CurrentDateTimeTool()]
 
-        tool_descriptions = []
-        for tool in tools:
-            tool_descriptions.append(f"- {tool.name}: {tool.description}")
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
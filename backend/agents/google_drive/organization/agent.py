@@ -2,7 +2,6 @@ from pathlib import Path
 from textwrap import dedent
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent
 from .tools import MoveFileTool, RenameFileTool, DeleteFileTool
@@ -25,9 +24,6 @@ class OrganizationAgent(BaseAgent):
             RenameFileTool(),
             DeleteFileTool(),
         ]
-        tool_descriptions = []
-        for tool in tools:
-            tool_descriptions.append(f"- {tool.name}: {tool.description}")
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Annotated
 
@@ -7,12 +8,36 @@ from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langgraph.types import interrupt
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_drive_service
+from core.cache import get_drive_cache
 from google_client.services.drive.types import DriveFolder
+from google_client.services.drive.utils import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
+# Same chunk size as the client's batch_* helpers, which keeps writes under Drive's per-user rate limit
+_BATCH_LIMIT = 10
+
+
+async def _batch_rename(drive, renames: list["RenameItem"]) -> list[dict | Exception]:
+    """Rename many items with one Drive batch request per 10 renames; results come back in request order."""
+    loop = asyncio.get_running_loop()
+    service = drive._service()
+    results = []
+    for i in range(0, len(renames), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(
+            callback=lambda _, response, exception: results.append(exception or response)
+        )
+        for rename in renames[i:i + _BATCH_LIMIT]:
+            batch.add(service.files().update(
+                fileId=rename.file_id,
+                body={"name": sanitize_filename(rename.new_name)},
+                fields="id,name"
+            ))
+        await loop.run_in_executor(drive._executor, batch.execute)
+    return results
+
 
 class MoveFileInput(BaseModel):
     file_ids: list[str] = Field(description="The file_ids or folder_ids to move")
@@ -33,47 +58,68 @@ class MoveFileTool(BaseGoogleTool):
             {"text": "Moving File...", "icon": "📦"}
         )
         drive = await get_drive_service(config)
-        target_folder = await drive.get(target_folder_id)
+        # batch_move needs each item's current parents; fetch them alongside the target instead of after it
+        target_folder, fetched = await asyncio.gather(
+            # Only the type check and the folder name are needed from the target, not its full resource
+            drive.get(target_folder_id, fields="id,name,mimeType"),
+            drive.batch_get(file_ids)
+        )
 
         if not isinstance(target_folder, DriveFolder):
             return f"Target {target_folder_id} is not a folder"
 
-        results = await drive.batch_move(
-            items=file_ids,
-            target_folder=target_folder,
-            remove_from_current_parents=True
-        )
+        items = [item for item in fetched if not isinstance(item, tuple)]
+        try:
+            results = await drive.batch_move(
+                items=items,
+                target_folder=target_folder,
+                remove_from_current_parents=True
+            ) if items else []
+        finally:
+            # Earlier batches may have gone through even if a later one raised
+            get_drive_cache(config).clear()
         successes = [r for r in results if not isinstance(r, tuple)]
-        errors = [r for r in results if isinstance(r, tuple)]
+        errors = [r for r in results if isinstance(r, tuple)] + [r for r in fetched if isinstance(r, tuple)]
         msg = f"{len(successes)} item(s) moved to '{target_folder.name}'."
         if errors:
             msg += f" {len(errors)} failed."
         return msg
 
 
-class RenameFileInput(BaseModel):
+class RenameItem(BaseModel):
     file_id: str = Field(description="The file_id or folder_id to rename")
     new_name: str = Field(description="New name for the file or folder")
 
 
+class RenameFileInput(BaseModel):
+    renames: list[RenameItem] = Field(description="The items to rename, each with its file_id and new name")
+
+
 class RenameFileTool(BaseGoogleTool):
     name: str = "rename_file"
-    description: str = "Rename a file or folder"
+    description: str = "Rename one or more files or folders."
     args_schema: ArgsSchema = RenameFileInput
 
-    def _run(self, file_id: str, new_name: str, config: Annotated[RunnableConfig, InjectedToolArg]) -> str:
+    def _run(self, renames: list[RenameItem], config: Annotated[RunnableConfig, InjectedToolArg]) -> str:
         raise NotImplementedError("Use async execution.")
 
-    async def _run_google_task(self, config: RunnableConfig, file_id: str, new_name: str) -> str:
+    async def _run_google_task(self, config: RunnableConfig, renames: list[RenameItem]) -> str:
         await adispatch_custom_event(
             "tool_status",
             {"text": "Renaming File...", "icon": "✏️"}
         )
         drive = await get_drive_service(config)
-        item = await drive.get(file_id)
-        updated_item = await drive.rename(item=item, name=new_name)
-
-        return f"Item renamed successfully to '{updated_item.name}'"
+        try:
+            results = await _batch_rename(drive, renames)
+        finally:
+            # Earlier batches may have gone through even if a later one raised
+            get_drive_cache(config).clear()
+        renamed = [{"id": r["id"], "name": r["name"]} for r in results if not isinstance(r, Exception)]
+        errors = len(results) - len(renamed)
+        msg = f"{len(renamed)} of {len(renames)} item(s) renamed: {to_json(renamed)}"
+        if errors:
+            msg += f" {errors} failed."
+        return msg
 
 
 class DeleteFileInput(BaseModel):
@@ -112,7 +158,11 @@ class DeleteFileTool(BaseGoogleTool):
             "tool_status",
             {"text": "Deleting File...", "icon": "🗑️"}
         )
-        results = await drive.batch_delete(items=file_ids)
+        try:
+            results = await drive.batch_delete(items=file_ids)
+        finally:
+            # Earlier batches may have gone through even if a later one raised
+            get_drive_cache(config).clear()
         successes = sum(1 for r in results if r is True)
         errors = sum(1 for r in results if isinstance(r, tuple))
         msg = f"{successes} of {len(file_ids)} item(s) deleted."
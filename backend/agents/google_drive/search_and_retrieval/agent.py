@@ -2,10 +2,10 @@ from pathlib import Path
 from textwrap import dedent
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 
 from agents.common.agent import BaseAgent
-from .tools import SearchFilesTool, GetFileTool, DownloadFileTool, ListFolderContentsTool, GetPermissionsTool, SaveAttachmentToDriveTool
+from .tools import SearchFilesTool, GetFileTool, DownloadFileTool, ListFolderContentsTool, ListFolderTreeTool, \
+    GetPermissionsTool, SaveAttachmentToDriveTool
 from ...common.tools import CurrentDateTimeTool
 
 _SYSTEM_PROMPT_TEMPLATE = Path(__file__).parent.joinpath('system_prompt.txt').read_text()
@@ -19,6 +19,7 @@ class SearchAndRetrievalAgent(BaseAgent):
             - Retrieve file/folder metadata and content (needs file_id or folder_id)
             - Download files (needs file_id)
             - List contents of folders (needs folder_id)
+            - List a whole folder tree, subfolders included, in one step
             - Get sharing permissions of files and folders (needs file_id or folder_id)
     """)
 
@@ -29,13 +30,11 @@ class SearchAndRetrievalAgent(BaseAgent):
             GetFileTool(),
             DownloadFileTool(),
             ListFolderContentsTool(),
+            ListFolderTreeTool(),
             GetPermissionsTool(),
             SaveAttachmentToDriveTool()
         ]
 
-        tool_descriptions = []
-        for tool in tools:
-            tool_descriptions.append(f"- {tool.name}: {tool.description}")
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(tools='\n'.join(tool_descriptions))
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         super().__init__(model, tools, system_prompt)
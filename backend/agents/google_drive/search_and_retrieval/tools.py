@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import tempfile
 import uuid
@@ -9,19 +8,52 @@ from typing import Optional, Annotated
 
 import mimetypes
 import filetype
+from google_client.services.drive.constants import DEFAULT_FILE_FIELDS
 from google_client.services.drive.types import DriveFile, DriveFolder, DriveItem
+from google_client.services.drive.utils import convert_api_file_to_correct_type
+from googleapiclient.errors import HttpError
 from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_drive_service, get_gmail_service
-from core.cache import get_email_cache
+from core.cache import get_email_cache, get_drive_cache
 from core.supabase_client import upload_to_supabase
 
 logger = logging.getLogger(__name__)
 
+# list_folder_tree bounds: deepest walk, total items returned, folders listed at once
+_TREE_MAX_DEPTH = 5
+_TREE_ITEM_LIMIT = 500
+_TREE_CONCURRENCY = 8
+
+# Same chunk size as the client's batch_* helpers
+_BATCH_GET_LIMIT = 10
+
+
+async def _batch_get(drive, file_ids: list[str]) -> dict[str, DriveItem | HttpError]:
+    """Fetch many items with one Drive batch request per 10 ids, keyed by file id.
+
+    The client's batch_get returns results in response order and drops the id from its errors, so a failure
+    can't be traced back to the file that caused it.
+    """
+    loop = asyncio.get_running_loop()
+    service = drive._service()
+    results = {}
+
+    def collect(file_id, response, exception):
+        results[file_id] = exception or convert_api_file_to_correct_type(response)
+
+    unique_ids = list(dict.fromkeys(file_ids))
+    for i in range(0, len(unique_ids), _BATCH_GET_LIMIT):
+        batch = service.new_batch_http_request(callback=collect)
+        for file_id in unique_ids[i:i + _BATCH_GET_LIMIT]:
+            batch.add(service.files().get(fileId=file_id, fields=DEFAULT_FILE_FIELDS), request_id=file_id)
+        await loop.run_in_executor(drive._executor, batch.execute)
+    return results
+
 
 class SearchFilesInput(BaseModel):
     query: Optional[str] = Field(default=None, description="Search query to find files by name or content")
@@ -102,6 +134,12 @@ class SearchFilesTool(BaseGoogleTool):
             "tool_status",
             {"text": "Searching Files...", "icon": "🔍"}
         )
+        cache = get_drive_cache(config)
+        cache_key = ("search", query, max_results, extension, folder_id, include_trashed, owned_by_me, shared_with_me,
+                     modified_after, modified_before, created_after, created_before, starred, include_folders,
+                     include_files, order_by)
+        if cached := cache.get(cache_key):
+            return cached
         drive = await get_drive_service(config)
         builder = drive.query()
 
@@ -136,9 +174,7 @@ class SearchFilesTool(BaseGoogleTool):
             return "Cannot exclude both files and folders"
 
         items = await builder.execute()
-        items_data = [self._item_to_dict(item) for item in items]
-
-        return json.dumps(items_data)
+        return cache.save(cache_key, to_json(items, default=self._item_to_dict))
 
     def _item_to_dict(self, item: DriveItem) -> dict:
         """Convert DriveItem to dict representation"""
@@ -146,8 +182,8 @@ class SearchFilesTool(BaseGoogleTool):
             "id": item.item_id,
             "name": item.name,
             "type": "folder" if isinstance(item, DriveFolder) else "file",
-            "created_time": item.created_time.isoformat() if item.created_time else None,
-            "modified_time": item.modified_time.isoformat() if item.modified_time else None,
+            "created_time": item.created_time,
+            "modified_time": item.modified_time,
             "web_view_link": item.web_view_link,
             "starred": item.starred,
             "trashed": item.trashed,
@@ -167,49 +203,62 @@ class SearchFilesTool(BaseGoogleTool):
 
 
 class GetFileInput(BaseModel):
-    file_id: str = Field(description="The file_id or folder_id of the item to retrieve")
+    file_ids: list[str] = Field(description="The file_ids or folder_ids of the items to retrieve")
 
 
 class GetFileTool(BaseGoogleTool):
     name: str = "get_file"
-    description: str = "Get detailed information about a specific file or folder by its ID"
+    description: str = "Get detailed information about one or more files or folders by their IDs"
     args_schema: ArgsSchema = GetFileInput
 
-    def _run(self, file_id: str, config: Annotated[RunnableConfig, InjectedToolArg]) -> str:
+    def _run(self, file_ids: list[str], config: Annotated[RunnableConfig, InjectedToolArg]) -> str:
         raise NotImplementedError("Use async execution.")
 
-    async def _run_google_task(self, config: RunnableConfig, file_id: str) -> str:
+    async def _run_google_task(self, config: RunnableConfig, file_ids: list[str]) -> str:
         await adispatch_custom_event(
             "tool_status",
             {"text": "Retrieving File Metadata...", "icon": "📄"}
         )
+        cache = get_drive_cache(config)
+        cache_key = ("files", tuple(file_ids))
+        if cached := cache.get(cache_key):
+            return cached
         drive = await get_drive_service(config)
-        item = await drive.get(file_id)
-
-        item_dict = {
-            "id": item.item_id,
-            "name": item.name,
-            "type": "folder" if isinstance(item, DriveFolder) else "file",
-            "created_time": item.created_time.isoformat() if item.created_time else None,
-            "modified_time": item.modified_time.isoformat() if item.modified_time else None,
-            "web_view_link": item.web_view_link,
-            "parent_ids": item.parent_ids,
-            "owners": item.owners,
-            "starred": item.starred,
-            "trashed": item.trashed,
-            "shared": item.shared,
-            "description": item.description,
-        }
+        # One batch request per 10 ids instead of one get per item
+        items = await _batch_get(drive, file_ids)
+
+        items_data = []
+        for file_id in file_ids:
+            item = items[file_id]
+            if isinstance(item, HttpError):
+                items_data.append({"id": file_id, "error": item.reason or "Could not retrieve item"})
+                continue
+
+            item_dict = {
+                "id": item.item_id,
+                "name": item.name,
+                "type": "folder" if isinstance(item, DriveFolder) else "file",
+                "created_time": item.created_time,
+                "modified_time": item.modified_time,
+                "web_view_link": item.web_view_link,
+                "parent_ids": item.parent_ids,
+                "owners": item.owners,
+                "starred": item.starred,
+                "trashed": item.trashed,
+                "shared": item.shared,
+                "description": item.description,
+            }
 
-        if isinstance(item, DriveFile):
-            item_dict.update({
-                "mime_type": item.mime_type,
-                "size": item.size,
-                "size_readable": item.human_readable_size() if item.size else None,
-                "file_extension": item.file_extension,
-            })
+            if isinstance(item, DriveFile):
+                item_dict.update({
+                    "mime_type": item.mime_type,
+                    "size": item.size,
+                    "size_readable": item.human_readable_size() if item.size else None,
+                    "file_extension": item.file_extension,
+                })
+            items_data.append(item_dict)
 
-        return json.dumps(item_dict)
+        return cache.save(cache_key, to_json(items_data))
 
 
 class DownloadFileInput(BaseModel):
@@ -231,7 +280,8 @@ class DownloadFileTool(BaseGoogleTool):
         )
         drive = await get_drive_service(config)
         user_id = config['configurable'].get('user_id')
-        file = await drive.get(file_id)
+        # get_file_payload only needs the mime type to choose export vs. direct download; skip the full '*' resource
+        file = await drive.get(file_id, fields="id,name,mimeType")
         if not isinstance(file, DriveFile):
             return f"Item {file_id} is a folder, not a file"
 
@@ -275,7 +325,7 @@ class DownloadFileTool(BaseGoogleTool):
             "size": size,
         }
 
-        return json.dumps(file_dict)
+        return to_json(file_dict)
 
 
 class ListFolderContentsInput(BaseModel):
@@ -312,6 +362,10 @@ class ListFolderContentsTool(BaseGoogleTool):
             "tool_status",
             {"text": "Listing Folder Contents...", "icon": "📂"}
         )
+        cache = get_drive_cache(config)
+        cache_key = ("folder", folder_id, max_results, include_files, include_folders)
+        if cached := cache.get(cache_key):
+            return cached
         drive = await get_drive_service(config)
         folder = await drive.get(folder_id)
         if not isinstance(folder, DriveFolder):
@@ -324,9 +378,7 @@ class ListFolderContentsTool(BaseGoogleTool):
             max_results=max_results
         )
 
-        items_data = [self._item_to_dict(item) for item in contents]
-
-        return json.dumps(items_data)
+        return cache.save(cache_key, to_json(contents, default=self._item_to_dict))
 
     def _item_to_dict(self, item: DriveItem) -> dict:
         base_dict = {
@@ -345,6 +397,96 @@ class ListFolderContentsTool(BaseGoogleTool):
         return base_dict
 
 
+class ListFolderTreeInput(BaseModel):
+    folder_id: Optional[str] = Field(default="root",
+                                     description="The folder_id to start from. Defaults to the root of My Drive")
+    max_depth: int = Field(default=3, ge=0, le=_TREE_MAX_DEPTH,
+                           description="How many levels of subfolders to descend into")
+    include_files: bool = Field(default=True, description="Whether to include files or only folders")
+
+
+class ListFolderTreeTool(BaseGoogleTool):
+    name: str = "list_folder_tree"
+    description: str = (
+        "List a folder and all of its subfolders down to max_depth levels as a nested tree. "
+        f"Returns at most {_TREE_ITEM_LIMIT} items; folders whose listing was cut off are marked truncated"
+    )
+    args_schema: ArgsSchema = ListFolderTreeInput
+
+    def _run(
+            self,
+            config: Annotated[RunnableConfig, InjectedToolArg],
+            folder_id: Optional[str] = "root",
+            max_depth: int = 3,
+            include_files: bool = True
+    ) -> str:
+        raise NotImplementedError("Use async execution.")
+
+    async def _run_google_task(
+            self,
+            config: RunnableConfig,
+            folder_id: Optional[str] = "root",
+            max_depth: int = 3,
+            include_files: bool = True
+    ) -> str:
+        await adispatch_custom_event(
+            "tool_status",
+            {"text": "Listing Folder Tree...", "icon": "📂"}
+        )
+        cache = get_drive_cache(config)
+        cache_key = ("tree", folder_id, max_depth, include_files)
+        if cached := cache.get(cache_key):
+            return cached
+        drive = await get_drive_service(config)
+
+        tree = {"id": folder_id or "root", "type": "folder", "children": []}
+        level = [tree]
+        remaining = _TREE_ITEM_LIMIT
+        semaphore = asyncio.Semaphore(_TREE_CONCURRENCY)
+
+        async def list_folder(node: dict, limit: int) -> list[DriveItem]:
+            async with semaphore:
+                return await drive.list_folder_contents(node["id"], include_files=include_files, max_results=limit)
+
+        for _ in range(max_depth):
+            if not level:
+                break
+            if not remaining:
+                for node in level:
+                    node["truncated"] = True
+                break
+            # List the folders on this level concurrently rather than walking the tree one folder at a time;
+            # no single listing can usefully return more than what is left of the item budget
+            listings = await asyncio.gather(
+                *[list_folder(node, remaining) for node in level],
+                return_exceptions=True
+            )
+            next_level = []
+            for node, contents in zip(level, listings):
+                if isinstance(contents, Exception):
+                    node["error"] = str(contents)
+                    continue
+                if len(contents) > remaining:
+                    contents = contents[:remaining]
+                    node["truncated"] = True
+                remaining -= len(contents)
+                for item in contents:
+                    if isinstance(item, DriveFolder):
+                        child = {"id": item.folder_id, "name": item.name, "type": "folder", "children": []}
+                        next_level.append(child)
+                    else:
+                        child = {"id": item.item_id, "name": item.name, "type": "file"}
+                    node["children"].append(child)
+            level = next_level
+
+        # Folders that were never listed (below max_depth or past the item budget) get no children key,
+        # so they don't read as empty
+        for node in level:
+            del node["children"]
+
+        return cache.save(cache_key, to_json(tree))
+
+
 class GetPermissionsInput(BaseModel):
     file_id: str = Field(description="The file_id or folder_id to get permissions for")
 
@@ -362,9 +504,11 @@ class GetPermissionsTool(BaseGoogleTool):
             "tool_status",
             {"text": "Retrieving Permissions...", "icon": "🔒"}
         )
+        cache = get_drive_cache(config)
+        if cached := cache.get(("permissions", file_id)):
+            return cached
         drive = await get_drive_service(config)
-        item = await drive.get(file_id)
-        permissions = await drive.get_permissions(item)
+        permissions = await drive.get_permissions(file_id)
 
         permissions_data = [
             {
@@ -378,7 +522,7 @@ class GetPermissionsTool(BaseGoogleTool):
             for perm in permissions
         ]
 
-        return json.dumps(permissions_data)
+        return cache.save(("permissions", file_id), to_json(permissions_data))
 
 
 class SaveAttachmentToDriveInput(BaseModel):
@@ -443,10 +587,11 @@ class SaveAttachmentToDriveTool(BaseGoogleTool):
                 tmp_path.unlink(missing_ok=True)
 
         results = await asyncio.gather(*[upload_one(a) for a in target_attachments], return_exceptions=True)
+        get_drive_cache(config).clear()
 
         successes = [r for r in results if not isinstance(r, Exception)]
         for err in results:
             if isinstance(err, Exception):
                 logger.error(f"Failed to save attachment to Drive: {err}")
 
-        return json.dumps(successes)
+        return to_json(successes)
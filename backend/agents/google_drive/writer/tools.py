@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 from agents.common.download_supabase_to_disk import download_to_disk
 from agents.common.tools import BaseGoogleTool
 from core.auth import get_drive_service
+from core.cache import get_drive_cache
 from google_client.services.drive.types import DriveFolder
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,7 @@ class UploadFileTool(BaseGoogleTool):
                 parent_folder_id=parent_folder_id,
                 description=description
             )
+            get_drive_cache(config).clear()
 
             return f"File uploaded successfully. file_id: {file.file_id}, name: {file.name}"
 
@@ -114,6 +116,7 @@ class CreateFolderTool(BaseGoogleTool):
             parent_folder=parent_folder,
             description=description
         )
+        get_drive_cache(config).clear()
 
         return f"Folder created successfully. folder_id: {folder.folder_id}, name: {folder.name}"
 
@@ -167,5 +170,6 @@ class ShareFileTool(BaseGoogleTool):
             notify=notify,
             message=message
         )
+        get_drive_cache(config).clear()
 
         return f"File shared successfully with {email} as {role}. permission_id: {permission.permission_id}"
\ No newline at end of file
@@ -8,6 +8,7 @@ from langchain_core.callbacks import adispatch_custom_event
 
 from agents.common.tools import BaseGoogleTool
 from core.auth import get_sheets_service
+from core.cache import get_drive_cache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,8 @@ class CreateSpreadsheetTool(BaseGoogleTool):
         await adispatch_custom_event("tool_status", {"text": "Creating Spreadsheet...", "icon": "📊"})
         sheets = await get_sheets_service(config)
         sheet = await sheets.create_spreadsheet(title)
+        # The new spreadsheet is a Drive file, so cached Drive searches/listings are now stale
+        get_drive_cache(config).clear()
         return f"Spreadsheet created successfully. spreadsheet_id: {sheet.spreadsheet_id}"
 
 
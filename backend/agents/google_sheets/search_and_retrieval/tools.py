@@ -1,12 +1,11 @@
 from typing import Optional, Annotated, List, Dict, Any
 from pydantic import BaseModel, Field
-import json
 import logging
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langchain_core.callbacks import adispatch_custom_event
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_sheets_service
 
 logger = logging.getLogger(__name__)
@@ -52,7 +51,7 @@ class GetValuesTool(BaseGoogleTool):
         sheets = await get_sheets_service(config)
         if as_dicts:
             data = await sheets.get_values_as_dicts(spreadsheet_id, range_name)
-            return json.dumps(data)
+            return to_json(data)
         else:
             data = await sheets.get_values(spreadsheet_id, range_name)
             if hasattr(data, 'model_dump_json'):
@@ -1,12 +1,11 @@
 from typing import Optional, Annotated, List, Dict, Any
 from pydantic import BaseModel, Field
-import json
 import logging
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from langchain_core.callbacks import adispatch_custom_event
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_sheets_service
 
 logger = logging.getLogger(__name__)
@@ -326,6 +325,6 @@ class BatchUpdateTool(BaseGoogleTool):
         sheets = await get_sheets_service(config)
         try:
             result = await sheets.batch_update(spreadsheet_id, requests)
-            return json.dumps(result)
+            return to_json(result)
         except Exception as e:
-            return f"Failed: {str(e)}"
+            return f"Failed: {e}"
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Optional, Literal, Union, Annotated
@@ -8,7 +7,7 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ArgsSchema, InjectedToolArg
 from pydantic import BaseModel, Field
 
-from agents.common.tools import BaseGoogleTool
+from agents.common.tools import BaseGoogleTool, to_json
 from core.auth import get_tasks_service
 from google_client.services.tasks import TaskQueryBuilder
 from google_client.services.tasks.async_query_builder import AsyncTaskQueryBuilder
@@ -135,7 +134,7 @@ class ListTasksTool(BaseGoogleTool):
                 }
             )
 
-        return json.dumps(tasks_data)
+        return to_json(tasks_data)
 
     def query_builder(self, service, params: dict) -> Union[TaskQueryBuilder, AsyncTaskQueryBuilder]:
         builder = service.query()
@@ -344,4 +343,4 @@ class ListTaskListsTool(BaseGoogleTool):
         )
         tasks_service = await get_tasks_service(config)
         task_lists = await tasks_service.list_task_lists()
-        return json.dumps([task_list.to_dict() for task_list in task_lists])
\ No newline at end of file
+        return to_json([task_list.to_dict() for task_list in task_lists])
\ No newline at end of file
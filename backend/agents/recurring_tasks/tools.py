@@ -37,10 +37,10 @@ class CreateRecursiveTaskTool(BaseTool):
             )
             return f"Successfully created recursive task '{name}'. ID: {record['id']}. It will first run at {record['next_run_at']} UTC."
         except ValueError as ve:
-            return f"Error creating task: {str(ve)}"
+            return f"Error creating task: {ve}"
         except Exception as e:
             logger.error(f"Error creating recursive task: {e}")
-            return f"Error creating task: {str(e)}"
+            return f"Error creating task: {e}"
 
 class DeleteRecursiveTaskInput(BaseModel):
     task_id: str = Field(..., description="The UUID of the task to delete")
@@ -64,7 +64,7 @@ class DeleteRecursiveTaskTool(BaseTool):
                 return f"Warning: Task {task_id} not found."
             return f"Successfully deleted Task {task_id}."
         except Exception as e:
-            return f"Error deleting task: {str(e)}"
+            return f"Error deleting task: {e}"
 
 class ListRecursiveTasksTool(BaseTool):
     name: str = "list_recursive_tasks"
@@ -88,7 +88,7 @@ class ListRecursiveTasksTool(BaseTool):
                 output += f"- ID: {row['id']} | Name: {row['name']} | Schedule: {row['human_schedule']} | Status: {row['status']} | Prompt: {row['prompt']}\n"
             return output
         except Exception as e:
-            return f"Error listing tasks: {str(e)}"
+            return f"Error listing tasks: {e}"
 
 class UpdateRecursiveTaskInput(BaseModel):
     task_id: str = Field(..., description="The UUID of the task to update")
@@ -123,7 +123,7 @@ class UpdateRecursiveTaskTool(BaseTool):
                 
             return f"Successfully updated Task {task_id}."
         except ValueError as ve:
-            return f"Error: {str(ve)}"
+            return f"Error: {ve}"
         except Exception as e:
             logger.error(f"Error updating task: {e}")
-            return f"Error updating task: {str(e)}"
+            return f"Error updating task: {e}"
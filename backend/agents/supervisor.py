@@ -2,7 +2,6 @@ from pathlib import Path
 
 from langchain.agents.structured_output import ToolStrategy
 from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
 from agents.common.agent import BaseAgent, agent_to_tool
@@ -25,15 +24,15 @@ class SupervisorAgent(BaseAgent):
     name: str = "SupervisorAgent"
     description: str = "A Google Workspace expert that can handle complex queries related to Gmail, Calendar, Tasks, and Drive"
 
-    def __init__(self, model: BaseChatModel, checkpointer: BaseCheckpointSaver):
+    def __init__(self, model: BaseChatModel, checkpointer: BaseCheckpointSaver, supervisor_model: BaseChatModel = None):
         tools = [
-            agent_to_tool(agent) for agent in [
-                GmailAgent(model),
-                CalendarAgent(model),
-                TasksAgent(model),
-                DriveAgent(model),
-                DocsAgent(model),
-                SheetsAgent(model),
+            agent_to_tool(agent_cls, model) for agent_cls in [
+                GmailAgent,
+                CalendarAgent,
+                TasksAgent,
+                DriveAgent,
+                DocsAgent,
+                SheetsAgent,
             ]
         ] + [
             CurrentDateTimeTool(), 
@@ -41,11 +40,8 @@ class SupervisorAgent(BaseAgent):
             CreateRecursiveTaskTool(), ListRecursiveTasksTool(), DeleteRecursiveTaskTool(), UpdateRecursiveTaskTool()
         ]
 
-        tool_descriptions = "\n".join(f"- {tool.name}: {tool.description}" for tool in tools)
-        system_prompt = PromptTemplate.from_template(_SYSTEM_PROMPT_TEMPLATE).format(
-            tools=tool_descriptions
-        )
+        system_prompt = self.build_system_prompt(_SYSTEM_PROMPT_TEMPLATE, tools)
 
         response_format = ToolStrategy(BotMessage)
 
-        super().__init__(model, tools, system_prompt, checkpointer, response_format)
+        super().__init__(supervisor_model or model, tools, system_prompt, checkpointer, response_format)
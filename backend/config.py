@@ -7,6 +7,8 @@ load_dotenv()
 
 class Config:
     DEFAULT_MODEL = os.environ.get("DEFAULT_MODEL", "gemini-2.5-flash")
+    # Optional lighter model for the supervisor's routing turns; sub-agents keep the user-selected model
+    SUPERVISOR_MODEL = os.getenv("SUPERVISOR_MODEL")
     ALLOWED_MODELS = {
         "gemini-3-pro-preview": "Gemini 3.0 Pro",
         "gemini-3-flash-preview": "Gemini 3.0 Flash",
@@ -30,6 +32,9 @@ class Config:
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
     SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+    # psycopg prepare_threshold. Unset disables server-side prepared statements, which transaction-mode
+    # poolers (Supavisor/PgBouncer on port 6543) do not support; set to 0 on direct or session-mode connections.
+    SUPABASE_DB_PREPARE_THRESHOLD = int(os.environ["SUPABASE_DB_PREPARE_THRESHOLD"]) if os.getenv("SUPABASE_DB_PREPARE_THRESHOLD") else None
     SUPABASE_USER_FILE_BUCKET = os.getenv("SUPABASE_USER_FILE_BUCKET")
 
     REDIS_HOST = os.getenv("REDIS_HOST")
@@ -48,6 +53,11 @@ class Config:
 
     AUTO_REPLY_HOURLY_LIMIT = int(os.getenv("AUTO_REPLY_HOURLY_LIMIT", "20"))
 
+    # How long list_calendars/list_events results are reused within a conversation; 0 disables the cache
+    CALENDAR_CACHE_TTL_SECONDS = float(os.getenv("CALENDAR_CACHE_TTL_SECONDS", "30"))
+    # Same for Drive search/metadata/listing/permission reads
+    DRIVE_CACHE_TTL_SECONDS = float(os.getenv("DRIVE_CACHE_TTL_SECONDS", "30"))
+
     # Cloud Tasks
     CLOUD_TASKS_PROJECT = os.getenv("CLOUD_TASKS_PROJECT")
     CLOUD_TASKS_LOCATION = os.getenv("CLOUD_TASKS_LOCATION")
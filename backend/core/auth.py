@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from google_client.api_service import APIServiceLayer
 from google_client.services.calendar import AsyncCalendarApiService
 from google_client.services.drive import AsyncDriveApiService
@@ -12,6 +14,15 @@ from core.exceptions import ProviderNotConnectedError
 from core.redis_client import redis_client
 
 
+_GOOGLE_SERVICE_CACHE_SIZE = 256
+_google_service_cache: OrderedDict = OrderedDict()
+
+
+def _token_key(token: dict) -> tuple:
+    """Hashable, order-independent key for a token dict. List values (e.g. scopes) become tuples."""
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in token.items()))
+
+
 async def get_google_service(user_id: str, timezone: str) -> APIServiceLayer:
     """Fetch Google API service layer from Redis/DB."""
     user_token = await redis_client.get_provider_token(user_id, 'google')
@@ -21,43 +32,56 @@ async def get_google_service(user_id: str, timezone: str) -> APIServiceLayer:
             raise ProviderNotConnectedError('Google')
         await redis_client.set_provider_token(user_id, 'google', user_token)
 
-    return APIServiceLayer(user_token, timezone)
+    # Reuse the service layer (and the API clients it has already built) while the stored token is unchanged
+    key = (_token_key(user_token), timezone)
+    if api_service := _google_service_cache.get(key):
+        _google_service_cache.move_to_end(key)
+        return api_service
 
+    api_service = APIServiceLayer(user_token, timezone)
+    _google_service_cache[key] = api_service
+    if len(_google_service_cache) > _GOOGLE_SERVICE_CACHE_SIZE:
+        _google_service_cache.popitem(last=False)
+    return api_service
 
-async def get_gmail_service(config: RunnableConfig) -> AsyncGmailApiService:
+
+_KIND_ATTR = {
+    'gmail': 'async_gmail',
+    'calendar': 'async_calendar',
+    'drive': 'async_drive',
+    'tasks': 'async_tasks',
+    'docs': 'async_docs',
+    'sheets': 'async_sheets',
+}
+
+
+def get_service(config: RunnableConfig, kind: str):
+    """Return the async Google service of the given kind from the turn's injected APIServiceLayer."""
     api_service = config['configurable'].get('api_service')
     if not api_service:
         raise ProviderNotConnectedError('Google')
-    return api_service.async_gmail
+    return getattr(api_service, _KIND_ATTR[kind])
+
+
+async def get_gmail_service(config: RunnableConfig) -> AsyncGmailApiService:
+    return get_service(config, 'gmail')
+
 
 async def get_calendar_service(config: RunnableConfig) -> AsyncCalendarApiService:
-    api_service = config['configurable'].get('api_service')
-    if not api_service:
-        raise ProviderNotConnectedError('Google')
-    return api_service.async_calendar
+    return get_service(config, 'calendar')
 
 
 async def get_drive_service(config: RunnableConfig) -> AsyncDriveApiService:
-    api_service = config['configurable'].get('api_service')
-    if not api_service:
-        raise ProviderNotConnectedError('Google')
-    return api_service.async_drive
+    return get_service(config, 'drive')
 
 
 async def get_tasks_service(config: RunnableConfig) -> AsyncTasksApiService:
-    api_service = config['configurable'].get('api_service')
-    if not api_service:
-        raise ProviderNotConnectedError('Google')
-    return api_service.async_tasks
+    return get_service(config, 'tasks')
+
 
 async def get_docs_service(config: RunnableConfig) -> AsyncDocsApiService:
-    api_service = config['configurable'].get('api_service')
-    if not api_service:
-        raise ProviderNotConnectedError('Google')
-    return api_service.async_docs
+    return get_service(config, 'docs')
+
 
 async def get_sheets_service(config: RunnableConfig) -> AsyncSheetsApiService:
-    api_service = config['configurable'].get('api_service')
-    if not api_service:
-        raise ProviderNotConnectedError('Google')
-    return api_service.async_sheets
+    return get_service(config, 'sheets')
@@ -1,4 +1,5 @@
 import re
+import time
 from collections import OrderedDict, defaultdict
 from functools import lru_cache
 from typing import Optional, DefaultDict
@@ -6,6 +7,8 @@ from typing import Optional, DefaultDict
 from google_client.services.gmail import EmailMessage
 from langchain_core.runnables import RunnableConfig
 
+from config import Config
+
 
 def remove_non_ascii(text):
     return text.encode("ascii", "ignore").decode("ascii")
@@ -58,3 +61,47 @@ def _get_email_cache(user_id: str) -> EmailCache:
 
 def get_email_cache(config: RunnableConfig) -> EmailCache:
     return _get_email_cache(config['configurable'].get('thread_id'))
+
+
+class ToolResultCache:
+    """Short-lived cache of serialized read results for one Google service; any write through that service clears it."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.max_size = 64
+        self._store: OrderedDict = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[str]:
+        if entry := self._store.get(key):
+            saved_at, value = entry
+            if time.monotonic() - saved_at < self.ttl:
+                return value
+            del self._store[key]
+        return None
+
+    def save(self, key: tuple, value: str) -> str:
+        if self.ttl > 0:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            if len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._store.clear()
+
+
+@lru_cache(maxsize=1000)
+def _get_calendar_cache(thread_id: str) -> ToolResultCache:
+    return ToolResultCache(Config.CALENDAR_CACHE_TTL_SECONDS)
+
+def get_calendar_cache(config: RunnableConfig) -> ToolResultCache:
+    return _get_calendar_cache(config['configurable'].get('thread_id'))
+
+
+@lru_cache(maxsize=1000)
+def _get_drive_cache(thread_id: str) -> ToolResultCache:
+    return ToolResultCache(Config.DRIVE_CACHE_TTL_SECONDS)
+
+def get_drive_cache(config: RunnableConfig) -> ToolResultCache:
+    return _get_drive_cache(config['configurable'].get('thread_id'))
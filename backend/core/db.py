@@ -8,10 +8,27 @@ from psycopg_pool import AsyncConnectionPool
 
 from config import Config
 from core.exceptions import ProviderNotConnectedError
-from core.token_encryption import token_encryptor
+from core.token_encryption import get_token_encryptor
 
 logger = logging.getLogger(__name__)
 
+_SQL_GET_PROVIDER_TOKEN = "SELECT credentials FROM public.user_integrations WHERE user_id = %s AND provider = %s"
+_SQL_UPSERT_PROVIDER_TOKEN = """
+    INSERT INTO public.user_integrations (user_id, provider, credentials, updated_at)
+    VALUES (%s, %s, %s, NOW())
+    ON CONFLICT (user_id, provider)
+    DO UPDATE SET
+        credentials = EXCLUDED.credentials, updated_at = NOW()
+"""
+_SQL_DELETE_PROVIDER_TOKEN = "DELETE FROM public.user_integrations WHERE user_id = %s AND provider = %s"
+_SQL_GET_USER_TIMEZONE = "SELECT timezone FROM public.user_settings WHERE user_id = %s"
+_SQL_UPSERT_USER_TIMEZONE = """
+    INSERT INTO public.user_settings (user_id, timezone)
+    VALUES (%s, %s)
+    ON CONFLICT (user_id) DO UPDATE SET timezone = EXCLUDED.timezone, updated_at = NOW()
+"""
+_SQL_PUBSUB_NOTIFICATION_EXISTS = "SELECT id FROM public.pubsub_notifications WHERE message_id = %s"
+
 
 class Database:
     def __init__(self):
@@ -29,7 +46,7 @@ class Database:
                 check=AsyncConnectionPool.check_connection,
                 kwargs={
                     "autocommit": True,
-                    "prepare_threshold": None,
+                    "prepare_threshold": Config.SUPABASE_DB_PREPARE_THRESHOLD,
                     "keepalives": 1,
                     "keepalives_idle": 30,
                     "keepalives_interval": 10,
@@ -73,32 +90,23 @@ class Database:
     async def get_provider_token(self, user_id: str, provider: str) -> dict:
         async with self._pool.connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
-                await cur.execute("SELECT * FROM public.user_integrations WHERE user_id = %s AND provider = %s ",
-                                  (user_id, provider))
+                await cur.execute(_SQL_GET_PROVIDER_TOKEN, (user_id, provider))
                 row = await cur.fetchone()
                 if not row:
                     raise ProviderNotConnectedError(provider)
 
-                return token_encryptor.decrypt(row['credentials'])
+                return get_token_encryptor().decrypt(row['credentials'])
 
     async def set_provider_token(self, user_id: str, provider: str, token: dict):
-        query = """
-            INSERT INTO public.user_integrations (user_id, provider, credentials, updated_at)
-            VALUES (%s, %s, %s, NOW())
-            ON CONFLICT (user_id, provider)
-            DO UPDATE SET 
-                credentials = EXCLUDED.credentials, updated_at = NOW()
-        """
         async with self._pool.connection() as conn:
             async with conn.cursor() as cur:
-                encrypted_token = token_encryptor.encrypt(token)
-                await cur.execute(query, (user_id, provider, encrypted_token))
+                encrypted_token = get_token_encryptor().encrypt(token)
+                await cur.execute(_SQL_UPSERT_PROVIDER_TOKEN, (user_id, provider, encrypted_token))
 
     async def delete_provider_token(self, user_id: str, provider: str):
-        query = "DELETE FROM public.user_integrations WHERE user_id = %s AND provider = %s"
         async with self._pool.connection() as conn:
             async with conn.cursor() as cur:
-                await cur.execute(query, (user_id, provider))
+                await cur.execute(_SQL_DELETE_PROVIDER_TOKEN, (user_id, provider))
 
     @asynccontextmanager
     async def connection(self):
@@ -134,24 +142,14 @@ class Database:
                 await cur.executemany(query, params_seq)
 
     async def get_user_timezone(self, user_id: str) -> str:
-        row = await self.fetch_one(
-            "SELECT timezone FROM public.user_settings WHERE user_id = %s",
-            (user_id,)
-        )
+        row = await self.fetch_one(_SQL_GET_USER_TIMEZONE, (user_id,))
         return row['timezone'] if row else 'UTC'
 
     async def set_user_timezone(self, user_id: str, timezone: str):
-        await self.execute(
-            """
-            INSERT INTO public.user_settings (user_id, timezone)
-            VALUES (%s, %s)
-            ON CONFLICT (user_id) DO UPDATE SET timezone = EXCLUDED.timezone, updated_at = NOW()
-            """,
-            (user_id, timezone)
-        )
+        await self.execute(_SQL_UPSERT_USER_TIMEZONE, (user_id, timezone))
 
     async def pubsub_notification_exists(self, message_id: int) -> bool:
-        row = await self.fetch_one("SELECT id FROM public.pubsub_notifications WHERE message_id = %s", (message_id,))
+        row = await self.fetch_one(_SQL_PUBSUB_NOTIFICATION_EXISTS, (message_id,))
         return bool(row)
 
 
@@ -10,6 +10,23 @@ from google.oauth2 import id_token
 
 logger = logging.getLogger(__name__)
 
+_BEARER_PREFIX = "Bearer "
+
+
+def _extract_bearer_token(authorization: str | None) -> str | None:
+    """Return the token from a `Bearer <token>` header, or None if the header is missing or malformed."""
+    if not authorization or not authorization.startswith(_BEARER_PREFIX):
+        return None
+    return authorization[len(_BEARER_PREFIX):] or None
+
+
+class _TicketUser:
+    """Minimal user object for WebSocket connections authenticated by a Redis ticket."""
+    __slots__ = ("id",)
+
+    def __init__(self, id: str):
+        self.id = id
+
 
 async def get_current_user_ws(websocket: WebSocket):
     ticket = websocket.query_params.get("ticket")
@@ -23,19 +40,14 @@ async def get_current_user_ws(websocket: WebSocket):
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
 
     logger.debug("WebSocket authentication successful", extra={"user_id": user_id})
-
-    class User:
-        def __init__(self, id):
-            self.id = id
-
-    return User(id=user_id)
+    return _TicketUser(id=user_id)
 
 
 async def get_current_user_http(authorization: str = Header(None)):
-    if not authorization:
-        logger.warning("HTTP request missing Authorization header")
+    token = _extract_bearer_token(authorization)
+    if not token:
+        logger.warning("HTTP request missing or malformed Authorization header")
         raise HTTPException(401, "Missing Token")
-    token = authorization.replace("Bearer ", "")
     try:
         client = await get_supabase()
         user_response = await client.auth.get_user(token)
@@ -43,17 +55,17 @@ async def get_current_user_http(authorization: str = Header(None)):
         logger.debug("HTTP authentication successful", extra={"user_id": user.id})
         return user
     except Exception as e:
-        logger.error(f"HTTP authentication failed: {e}")
+        logger.warning(f"HTTP authentication failed: {e}")
         raise HTTPException(401, "Invalid Token")
 
 
 def verify_google_token(audience: str, expected_email: str):
 
     async def dependency(authorization: str = Header(None)):
-        if not authorization:
-            logger.warning("Google token missing Authorization header")
+        token = _extract_bearer_token(authorization)
+        if not token:
+            logger.warning("Google token missing or malformed Authorization header")
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Missing Token")
-        token = authorization.replace("Bearer ", "")
         try:
             id_info = await asyncio.to_thread(
                 id_token.verify_oauth2_token, 
@@ -4,7 +4,7 @@ import time
 from redis.asyncio import Redis
 
 from config import Config
-from core.token_encryption import token_encryptor
+from core.token_encryption import get_token_encryptor
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +29,11 @@ class RedisClient:
         token = await self.redis.get(f"{user_id}:{provider}")
         if not token:
             return None
-        return token_encryptor.decrypt(token)
+        return get_token_encryptor().decrypt(token)
 
     async def set_provider_token(self, user_id: str, provider: str, token: dict) -> None:
         logger.debug(f"Set provider token for user {user_id}, provider {provider}")
-        token = token_encryptor.encrypt(token)
+        token = get_token_encryptor().encrypt(token)
         await self.redis.set(f"{user_id}:{provider}", token, ex=3600)
 
     async def delete_provider_token(self, user_id: str, provider: str) -> None:
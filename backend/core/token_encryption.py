@@ -3,8 +3,11 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 import base64
-import json
 import logging
+from functools import lru_cache
+
+import orjson
+
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -32,16 +35,14 @@ class TokenEncryption:
 
     def encrypt(self, token: dict) -> str:
         try:
-            json_bytes = json.dumps(token).encode('utf-8')
-            return self.fernet.encrypt(json_bytes).decode('utf-8')
+            return self.fernet.encrypt(orjson.dumps(token)).decode('utf-8')
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             raise
 
     def decrypt(self, encrypted_token: str) -> dict:
         try:
-            decrypted_bytes = self.fernet.decrypt(encrypted_token.encode('utf-8'))
-            return json.loads(decrypted_bytes.decode('utf-8'))
+            return orjson.loads(self.fernet.decrypt(encrypted_token.encode('utf-8')))
         except InvalidToken:
             logger.warning("Decryption failed: Invalid Token")
             return None
@@ -50,4 +51,7 @@ class TokenEncryption:
             return None
 
 
-token_encryptor = TokenEncryption()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_token_encryptor() -> TokenEncryption:
+    """Return the process-wide TokenEncryption, deriving its key on first use."""
+    return TokenEncryption()
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
@@ -14,6 +16,7 @@ from agents.supervisor import SupervisorAgent
 from config import Config
 from core.db import database
 from core.rate_limit import RateLimitMiddleware
+from core.token_encryption import get_token_encryptor
 from logging_config import setup_logging
 from routes.auth import router as auth_router
 from routes.auto_reply import router as auto_reply_router
@@ -46,6 +49,9 @@ class _MemoryCache(_DiscoveryCache):
 
 
 googleapiclient.discovery_cache.autodetect = lambda: _MemoryCache()
+# build() defaults to the discovery docs bundled with the library, which bypass the cache above
+# and are re-read from disk on every call; every Google API request goes through build()
+googleapiclient.discovery_cache.get_static_doc = lru_cache(maxsize=None)(googleapiclient.discovery_cache.get_static_doc)
 
 
 async def _renew_watches_job():
@@ -57,26 +63,35 @@ async def _renew_watches_job():
         logger.error(f"Gmail watch renewal job failed: {e}", exc_info=True)
 
 
+def _supervisor_llm() -> ChatGoogleGenerativeAI | None:
+    return ChatGoogleGenerativeAI(model=Config.SUPERVISOR_MODEL) if Config.SUPERVISOR_MODEL else None
+
+
 def get_agent(app, model_name: str) -> SupervisorAgent:
     """Get or lazily create a SupervisorAgent for the given model."""
     if model_name not in Config.ALLOWED_MODELS:
         model_name = Config.DEFAULT_MODEL
     if model_name not in app.state.agents:
         llm = ChatGoogleGenerativeAI(model=model_name)
-        app.state.agents[model_name] = SupervisorAgent(model=llm, checkpointer=app.state.checkpointer)
+        app.state.agents[model_name] = SupervisorAgent(
+            model=llm, checkpointer=app.state.checkpointer, supervisor_model=_supervisor_llm()
+        )
         logger.info(f"Created agent for model: {model_name}")
     return app.state.agents[model_name]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await database.connect()
-    checkpointer = await database.get_checkpointer()
-    store = await database.get_store()
+    # Derive the token encryption key off the event loop while the pool connects
+    await asyncio.gather(database.connect(), asyncio.to_thread(get_token_encryptor))
+    # Checkpointer and store are process-wide singletons; their schema setups are independent
+    checkpointer, store = await asyncio.gather(database.get_checkpointer(), database.get_store())
     app.state.checkpointer = checkpointer
     app.state.store = store
     default_llm = ChatGoogleGenerativeAI(model=Config.DEFAULT_MODEL)
-    app.state.agents = {Config.DEFAULT_MODEL: SupervisorAgent(model=default_llm, checkpointer=checkpointer)}
+    app.state.agents = {Config.DEFAULT_MODEL: SupervisorAgent(
+        model=default_llm, checkpointer=checkpointer, supervisor_model=_supervisor_llm()
+    )}
 
     # Start APScheduler for auto-reply background jobs
     scheduler = AsyncIOScheduler()
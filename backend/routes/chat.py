@@ -67,14 +67,15 @@ async def process_message(
     is_connected = True
     message_received_at = time.time()
 
+    configurable = config.get("configurable", {})
     message_config = RunnableConfig(
         configurable={
             "thread_id": user_id,
             "user_id": user_id,
-            "timezone": config.get("configurable", {}).get("timezone", "UTC"),
+            "timezone": configurable.get("timezone", "UTC"),
             "api_service": api_service,
             "store": websocket.app.state.store,
-            "session_memories": config.get("configurable", {}).get("session_memories", "")
+            "session_memories": configurable.get("session_memories", "")
         },
         recursion_limit=50
     )
@@ -100,7 +101,7 @@ async def process_message(
                 full_message += f"File Path: {file.path}"
 
         messages = []
-        memories = message_config.get("configurable", {}).get("session_memories")
+        memories = message_config["configurable"]["session_memories"]
         if memories:
             messages.append(SystemMessage(content=memories, id="ephemeral_memory_injection"))
         
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -69,7 +70,8 @@ async def delete_integration(
         token = await database.get_provider_token(user.id, provider)
         await database.delete_provider_token(user.id, provider)
         await redis_client.delete_provider_token(user.id, provider)
-        if APIServiceLayer(token).revoke_token():
+        # revoke_token posts with blocking `requests`; keep it off the event loop
+        if await asyncio.to_thread(APIServiceLayer(token).revoke_token):
             logger.info("Integration removed", extra={"user_id": user.id, "provider": provider})
             return {"message": "Integration removed"}
     except Exception as e:
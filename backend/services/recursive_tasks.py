@@ -162,7 +162,7 @@ class RecursiveTaskService:
             status = "success"
         except Exception as e:
             logger.error(f"Execution failed for task {task_id}: {e}")
-            text_content = f"Error: {str(e)}"
+            text_content = f"Error: {e}"
             status = "failed"
             # We must remember to raise this at the end so Cloud Tasks retries it
             agent_exception = e
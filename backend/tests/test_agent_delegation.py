@@ -0,0 +1,55 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from agents.common.agent import agent_to_tool
+
+
+class FakeAgent:
+    name = "fake_agent"
+    description = "A fake agent."
+    runs = []
+
+    def __init__(self, model):
+        pass
+
+    async def arun(self, task, config):
+        FakeAgent.runs.append(task)
+        await asyncio.sleep(0.01)
+        return f"done: {task}"
+
+
+def _config(run_id):
+    return {"configurable": {"thread_id": "thread-1"}, "callbacks": SimpleNamespace(parent_run_id=run_id)}
+
+
+def _delegate(calls):
+    FakeAgent.runs = []
+    tool = agent_to_tool(FakeAgent, model=None)
+
+    async def run():
+        return await asyncio.gather(*(tool._arun(task, config) for task, config in calls))
+
+    return asyncio.run(run())
+
+
+def test_identical_delegations_in_the_same_run_share_one_agent_run():
+    run_id = uuid.uuid4()
+    results = _delegate([("Archive  message 18f3A", _config(run_id)), ("Archive message 18f3A", _config(run_id))])
+
+    assert len(FakeAgent.runs) == 1
+    assert results[0] == results[1]
+
+
+def test_delegations_differing_in_id_case_are_not_merged():
+    run_id = uuid.uuid4()
+    results = _delegate([("Archive message 18f3A", _config(run_id)), ("Archive message 18f3a", _config(run_id))])
+
+    assert sorted(FakeAgent.runs) == ["Archive message 18f3A", "Archive message 18f3a"]
+    assert results == ["done: Archive message 18f3A", "done: Archive message 18f3a"]
+
+
+def test_delegations_reporting_to_different_runs_are_not_merged():
+    _delegate([("Archive message 18f3A", _config(uuid.uuid4())), ("Archive message 18f3A", _config(uuid.uuid4()))])
+
+    assert len(FakeAgent.runs) == 2
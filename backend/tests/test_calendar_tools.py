@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from agents.google_calendar import tools
+from google_client.services.calendar import CalendarEvent
+
+
+class FakeCalendar:
+    def __init__(self):
+        self.created = []
+
+    async def batch_create_events(self, events, calendar_id):
+        self.created.extend(events)
+        return [CalendarEvent(event_id=f"e{i}", calendar_id=calendar_id, summary=event["summary"])
+                for i, event in enumerate(events)]
+
+
+def test_create_events_builds_every_event_from_the_input_models():
+    calendar = FakeCalendar()
+
+    async def run():
+        with patch.object(tools, "get_calendar_service", AsyncMock(return_value=calendar)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tools.CreateEventsTool().ainvoke(
+                {"events": [
+                    {"summary": "Standup", "start_datetime": "2025-01-06T09:00:00",
+                     "end_datetime": "2025-01-06T09:15:00", "attendees": ["a@example.com"]},
+                    {"summary": "Review", "start_datetime": "2025-01-06T14:00:00",
+                     "end_datetime": "2025-01-06T15:00:00"},
+                ]},
+                config={"configurable": {"thread_id": "test-thread"}}
+            )
+
+    result = asyncio.run(run())
+
+    assert result.startswith("2 of 2 event(s) created")
+    assert [event["summary"] for event in calendar.created] == ["Standup", "Review"]
+    assert [attendee.email for attendee in calendar.created[0]["attendees"]] == ["a@example.com"]
+    assert calendar.created[1]["attendees"] == []
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeEvents:
+    def __init__(self, response):
+        self.response = response
+        self.patches = []
+
+    def patch(self, calendarId, eventId, body):
+        self.patches.append((calendarId, eventId, body))
+        return FakeRequest(self.response)
+
+
+class FakePatchCalendar:
+    def __init__(self, response):
+        self._executor = RecordingExecutor()
+        self.events = FakeEvents(response)
+
+    def _service(self):
+        return SimpleNamespace(events=lambda: self.events)
+
+
+def _update(calendar, args):
+    async def run():
+        with patch.object(tools, "get_calendar_service", AsyncMock(return_value=calendar)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tools.UpdateEventTool().ainvoke(args, config={"configurable": {"thread_id": "test-thread"}})
+
+    return asyncio.run(run())
+
+
+def test_update_event_patches_only_the_given_fields_on_the_client_executor():
+    calendar = FakePatchCalendar({"id": "e1"})
+    result = _update(calendar, {"event_id": "e1", "summary": "Renamed", "location": "Room 2"})
+
+    assert result == "Event updated successfully. event_id: e1, calendar_id: primary"
+    assert calendar.events.patches == [("primary", "e1", {"summary": "Renamed", "location": "Room 2"})]
+    assert calendar._executor.submitted == 1
+
+
+def test_update_event_reports_api_errors_like_other_calendar_tools():
+    error = HttpError(httplib2.Response({"status": 404}), b"", uri="events/e1")
+    result = _update(FakePatchCalendar(error), {"event_id": "e1", "summary": "Renamed"})
+
+    assert result.startswith("An error occurred while accessing Google:")
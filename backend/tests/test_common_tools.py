@@ -0,0 +1,30 @@
+import json
+from datetime import date, datetime, timezone
+
+from agents.common.tools import to_json
+
+
+def test_to_json_matches_stdlib_for_plain_results():
+    data = [{"id": "a", "labels": ["INBOX"], "count": 3, "read": False, "size": None}]
+    assert json.loads(to_json(data)) == data
+
+
+def test_to_json_stringifies_non_str_keys():
+    assert json.loads(to_json({1: "a", 2: "b"})) == {"1": "a", "2": "b"}
+
+
+def test_to_json_falls_back_for_integers_wider_than_64_bits():
+    assert to_json({"big": 2 ** 70}) == json.dumps({"big": 2 ** 70})
+
+
+def test_to_json_uses_default_for_unknown_types():
+    assert json.loads(to_json({"day": {date(2026, 1, 2)}}, default=sorted)) == {"day": ["2026-01-02"]}
+
+
+def test_to_json_fallback_still_encodes_datetimes_and_unknown_types():
+    payload = {"big": 2 ** 70, "created": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "tags": {"a"}}
+
+    assert json.loads(to_json(payload, default=sorted)) == {
+        "big": 2 ** 70, "created": "2026-01-02T03:04:05+00:00", "tags": ["a"]
+    }
+    assert json.loads(to_json(payload))["tags"] == "{'a'}"
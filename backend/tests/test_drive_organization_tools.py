@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from agents.google_drive.organization import tools
+
+
+class FakeBatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request):
+        self.requests.append(request)
+
+    def execute(self):
+        for i, request in enumerate(self.requests):
+            self.callback(str(i), {"id": request["fileId"], "name": request["body"]["name"]}, None)
+
+
+class FakeFiles:
+    def update(self, fileId, body, fields):
+        return {"fileId": fileId, "body": body}
+
+
+class FakeService:
+    def __init__(self):
+        self.batches = []
+
+    def new_batch_http_request(self, callback):
+        batch = FakeBatch(callback)
+        self.batches.append(batch)
+        return batch
+
+    def files(self):
+        return FakeFiles()
+
+
+class FakeDrive:
+    def __init__(self):
+        self.service = FakeService()
+        self._executor = None
+
+    def _service(self):
+        return self.service
+
+
+def _invoke(tool, args, drive):
+    async def run():
+        with patch.object(tools, "get_drive_service", AsyncMock(return_value=drive)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tool.ainvoke(args, config={"configurable": {"thread_id": "test-thread"}})
+
+    return asyncio.run(run())
+
+
+def test_rename_file_renames_every_item_through_one_batch():
+    drive = FakeDrive()
+    result = _invoke(
+        tools.RenameFileTool(),
+        {"renames": [{"file_id": "f1", "new_name": "Report"}, {"file_id": "f2", "new_name": "Notes"}]},
+        drive
+    )
+
+    assert result.startswith("2 of 2 item(s) renamed")
+    assert '"id":"f1","name":"Report"' in result
+    assert len(drive.service.batches) == 1
+
+
+def test_rename_file_splits_large_requests_into_batches():
+    drive = FakeDrive()
+    renames = [{"file_id": f"f{i}", "new_name": f"name {i}"} for i in range(25)]
+    result = _invoke(tools.RenameFileTool(), {"renames": renames}, drive)
+
+    assert result.startswith("25 of 25 item(s) renamed")
+    # Chunked like the client's own batch helpers to stay under Drive's per-user write rate limit
+    assert [len(batch.requests) for batch in drive.service.batches] == [10, 10, 5]
+
+
+def test_rename_file_clears_cached_listings_when_a_batch_raises():
+    class FailingBatch(FakeBatch):
+        def execute(self):
+            raise RuntimeError("connection reset")
+
+    class FailingSecondBatch(FakeService):
+        def new_batch_http_request(self, callback):
+            batch = FailingBatch(callback) if self.batches else FakeBatch(callback)
+            self.batches.append(batch)
+            return batch
+
+    drive = FakeDrive()
+    drive.service = FailingSecondBatch()
+    cache = tools.get_drive_cache({"configurable": {"thread_id": "test-thread"}})
+    cache.save(("folder", "root"), "[]")
+
+    renames = [{"file_id": f"f{i}", "new_name": f"name {i}"} for i in range(tools._BATCH_LIMIT + 1)]
+    result = _invoke(tools.RenameFileTool(), {"renames": renames}, drive)
+
+    assert result == "Unable to complete the task due to an internal error."
+    assert cache.get(("folder", "root")) is None
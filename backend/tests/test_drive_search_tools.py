@@ -0,0 +1,122 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from google_client.services.drive.types import DriveFile, DriveFolder
+from pydantic import ValidationError
+
+from agents.google_drive.search_and_retrieval import tools
+
+
+class FakeDrive:
+    """A root folder holding `width` subfolders, each holding `width` files."""
+
+    def __init__(self, width: int):
+        self.width = width
+        self.active = 0
+        self.max_active = 0
+
+    async def list_folder_contents(self, folder_id, include_files=True, max_results=100):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        if folder_id == "root":
+            items = [DriveFolder(item_id=f"d{i}", name=f"Folder {i}") for i in range(self.width)]
+        else:
+            items = [DriveFile(item_id=f"{folder_id}-f{i}", name=f"file {i}") for i in range(self.width)]
+        return items[:max_results]
+
+
+def _tree(drive, args):
+    async def run():
+        with patch.object(tools, "get_drive_service", AsyncMock(return_value=drive)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tools.ListFolderTreeTool().ainvoke(args, config={"configurable": {"thread_id": repr(args)}})
+
+    return json.loads(asyncio.run(run()))
+
+
+@pytest.mark.parametrize("max_depth", [None, -1, tools._TREE_MAX_DEPTH + 1])
+def test_max_depth_outside_bounds_is_rejected(max_depth):
+    with pytest.raises(ValidationError):
+        _tree(FakeDrive(2), {"max_depth": max_depth})
+
+
+def test_folders_below_max_depth_have_no_children_key():
+    tree = _tree(FakeDrive(2), {"max_depth": 1})
+
+    assert [child["id"] for child in tree["children"]] == ["d0", "d1"]
+    assert all("children" not in child for child in tree["children"])
+
+
+def test_wide_tree_is_capped_and_marked_truncated():
+    drive = FakeDrive(40)
+    tree = _tree(drive, {"max_depth": 3})
+
+    listed = [child for folder in tree["children"] for child in folder.get("children", [])]
+    assert len(tree["children"]) + len(listed) == tools._TREE_ITEM_LIMIT
+    assert any(folder.get("truncated") for folder in tree["children"])
+    assert drive.max_active <= tools._TREE_CONCURRENCY
+
+
+class ReversedBatch:
+    """Answers sub-requests in reverse order, as a batch response is free to."""
+
+    def __init__(self, callback, missing):
+        self.callback = callback
+        self.missing = missing
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append(request_id)
+
+    def execute(self):
+        for file_id in reversed(self.requests):
+            if file_id in self.missing:
+                content = json.dumps({"error": {"message": f"File not found: {file_id}."}}).encode()
+                self.callback(file_id, None, HttpError(httplib2.Response({"status": 404}), content))
+            else:
+                self.callback(file_id, {"id": file_id, "name": f"name of {file_id}",
+                                        "mimeType": "application/pdf"}, None)
+
+
+class FakeBatchDrive:
+    def __init__(self, missing=()):
+        self._executor = None
+        self.missing = set(missing)
+        self.batches = []
+
+    def _service(self):
+        return self
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields):
+        return fileId
+
+    def new_batch_http_request(self, callback):
+        batch = ReversedBatch(callback, self.missing)
+        self.batches.append(batch)
+        return batch
+
+
+def test_get_file_matches_results_and_errors_to_their_file_ids():
+    drive = FakeBatchDrive(missing={"b"})
+
+    async def run():
+        with patch.object(tools, "get_drive_service", AsyncMock(return_value=drive)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tools.GetFileTool().ainvoke(
+                {"file_ids": ["a", "b", "c"]}, config={"configurable": {"thread_id": "get-file"}}
+            )
+
+    items = json.loads(asyncio.run(run()))
+
+    assert [item["id"] for item in items] == ["a", "b", "c"]
+    assert items[0]["name"] == "name of a" and items[2]["name"] == "name of c"
+    assert items[1] == {"id": "b", "error": "File not found: b."}
@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from agents.gmail.organization import tools
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"{}")
+
+
+class FakeRequest:
+    def __init__(self, error):
+        self.error = error
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return {}
+
+
+class FakeMessages:
+    def __init__(self, gmail):
+        self.gmail = gmail
+
+    def batchModify(self, userId, body):
+        self.gmail.batches.append(body["ids"])
+        return FakeRequest(self.gmail.batch_errors.pop(0) if self.gmail.batch_errors else None)
+
+    def modify(self, userId, id, body):
+        self.gmail.per_message.append((id, body))
+        return FakeRequest(_http_error(404) if id in self.gmail.failing_ids else None)
+
+
+class FakeGmail:
+    def __init__(self, batch_errors=(), failing_ids=()):
+        self._executor = None
+        self.batch_errors = list(batch_errors)
+        self.failing_ids = set(failing_ids)
+        self.batches = []
+        self.per_message = []
+
+    def _service(self):
+        return self
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return FakeMessages(self)
+
+
+def _run(tool, gmail, message_ids):
+    async def run():
+        with patch.object(tools, "get_gmail_service", AsyncMock(return_value=gmail)), \
+                patch.object(tools, "adispatch_custom_event", AsyncMock()):
+            return await tool._run_google_task(
+                {"configurable": {"thread_id": "test-thread"}}, message_ids=message_ids, label_id="STARRED"
+            )
+
+    return asyncio.run(run())
+
+
+def _apply(gmail, message_ids):
+    return _run(tools.ApplyLabelTool(), gmail, message_ids)
+
+
+def test_bad_id_only_retries_the_failing_chunk():
+    limit = tools._BATCH_MODIFY_LIMIT
+    message_ids = [f"m{i}" for i in range(limit + 2)]
+    gmail = FakeGmail(batch_errors=[None, _http_error(400)], failing_ids={f"m{limit}"})
+
+    result = _apply(gmail, message_ids)
+
+    assert sorted(gmail.per_message) == [(mid, {"addLabelIds": ["STARRED"]}) for mid in sorted(message_ids[limit:])]
+    assert result == f"Label STARRED applied to {limit + 1} of {limit + 2} email(s)."
+
+
+@pytest.mark.parametrize("status", [429, 500, 403])
+def test_other_http_errors_are_not_retried_per_message(status):
+    gmail = FakeGmail(batch_errors=[_http_error(status)])
+
+    with pytest.raises(HttpError):
+        _apply(gmail, ["m1", "m2"])
+    assert gmail.per_message == []
+
+
+def test_remove_label_falls_back_to_per_message_removals():
+    gmail = FakeGmail(batch_errors=[_http_error(404)], failing_ids={"m2"})
+
+    result = _run(tools.RemoveLabelTool(), gmail, ["m1", "m2", "m3"])
+
+    assert sorted(gmail.per_message) == [(mid, {"removeLabelIds": ["STARRED"]}) for mid in ["m1", "m2", "m3"]]
+    assert result == "Label STARRED removed from 2 of 3 email(s)."